@@ -12,38 +12,125 @@ Requirements:
 
 import os
 import sys
+import atexit
+import csv
+import tempfile
+import uuid
 import logging
+import logging.handlers
+import queue
+import sqlite3
 import yaml
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from boto3.exceptions import Boto3Error
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+import threading
+from collections import namedtuple
 import time
+from http.client import HTTPConnection
+from urllib.parse import quote
 
-# Configure logging
+# Configure logging. Records are formatted by the QueueHandler and written by
+# a background QueueListener so copy workers never block on handler locks.
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.FileHandler('s3_sync.log'),
+    logging.StreamHandler(sys.stdout)
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('s3_sync.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
+log_listener.start()
+# Flush any queued log records before the interpreter exits
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# copy_object is limited to 5 GB per request; anything at or above this size
+# is copied server-side with parallel UploadPartCopy requests instead
+MULTIPART_COPY_THRESHOLD = 5 * 1024 ** 3
+
+# Each multipart copy runs its own UploadPartCopy threads, so large objects get
+# a small executor of their own and the connection pool is sized for them
+MULTIPART_COPY_SLOTS = 4
+MULTIPART_COPY_CONCURRENCY = 16
+
+# Local database recording completed copies so interrupted syncs can resume
+STATE_DB_FILE = 's3_sync_state.db'
+
+# Number of completed copies buffered before being written to the state database
+STATE_COMMIT_BATCH_SIZE = 1000
+
+# Listed objects buffered ahead of the copy loop by the listing thread
+LISTING_QUEUE_SIZE = 10000
+
+# Completed copies accumulated before the progress bar is updated
+PROGRESS_UPDATE_BATCH = 64
+
+# Socket write buffer used in place of http.client's 8 KB default
+HTTP_BLOCKSIZE = 1024 * 1024
+
+# Seconds between status checks on S3 Batch Operations jobs
+BATCH_POLL_INTERVAL = 30
+
+# Batch Operations job states after which a job will make no further progress
+BATCH_TERMINAL_STATUSES = ('Complete', 'Failed', 'Cancelled')
+
+# Prefix for Batch Operations manifests and failure reports in the manifest bucket
+BATCH_MANIFEST_PREFIX = 's3-sync-manifests'
+
+# One (object, destination) copy operation
+CopyTask = namedtuple('CopyTask', 'src dst key etag size')
+
 
 class S3BucketSync:
-    def __init__(self, config_file='buckets.yaml'):
+    _http_blocksize_patched = False
+    
+    def __init__(self, config_file='buckets.yaml', state_file=STATE_DB_FILE):
         """Initialize the S3 sync utility."""
         self.config_file = config_file
+        self.state_file = state_file
+        self.session = None
         self.s3_client = None
+        self.state_db = None
+        self._state_batch = []
         self.bucket_configs = []
         self.total_files_copied = 0
         self.total_files_failed = 0
+        self.total_buckets_failed = 0
+        self.total_files_skipped = 0
+        self.max_workers = 64
+        self.transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=MULTIPART_COPY_CONCURRENCY,
+            use_threads=True
+        )
         
+    @classmethod
+    def _patch_http_blocksize(cls):
+        """Raise the default HTTPConnection write buffer to cut small send() calls."""
+        if cls._http_blocksize_patched:
+            return
+        
+        HTTPConnection.__init__.__defaults__ = tuple(
+            HTTP_BLOCKSIZE if default == 8192 else default
+            for default in HTTPConnection.__init__.__defaults__
+        )
+        cls._http_blocksize_patched = True
+    
     def _initialize_s3_client(self):
         """Initialize boto3 S3 client using environment variables."""
         try:
+            # Must happen before the client opens any connections
+            self._patch_http_blocksize()
+            
             # Check if AWS credentials are available
             session = boto3.Session()
             credentials = session.get_credentials()
@@ -51,7 +138,22 @@ class S3BucketSync:
             if not credentials:
                 raise NoCredentialsError()
                 
-            self.s3_client = boto3.client('s3')
+            # Size the connection pool to the worker pool plus the part
+            # threads of concurrent multipart copies so threads don't
+            # queue on urllib3 connection acquisition. Adaptive retries back
+            # off exponentially and rate-limit the shared client when S3
+            # returns SlowDown. Request parameters are built by this script,
+            # so client-side validation is skipped.
+            client_config = Config(
+                max_pool_connections=self.max_workers + MULTIPART_COPY_SLOTS * MULTIPART_COPY_CONCURRENCY,
+                retries={'mode': 'adaptive', 'max_attempts': 10},
+                tcp_keepalive=True,
+                signature_version='s3v4',
+                parameter_validation=False,
+                s3={'addressing_style': 'virtual', 'us_east_1_regional_endpoint': 'regional'}
+            )
+            self.session = session
+            self.s3_client = session.client('s3', config=client_config)
             logger.info("Successfully initialized S3 client")
             
         except NoCredentialsError:
@@ -72,13 +174,18 @@ class S3BucketSync:
                 sys.exit(1)
                 
             with open(self.config_file, 'r') as file:
-                config = yaml.safe_load(file)
+                # Prefer the libyaml-backed loader, falling back to pure Python
+                config = yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
                 
             if 'buckets' not in config:
                 logger.error("Invalid configuration: 'buckets' key not found")
                 sys.exit(1)
                 
             self.bucket_configs = config['buckets']
+            self.max_workers = int(config.get('max_workers', self.max_workers))
+            if self.max_workers < 1:
+                logger.error(f"Invalid configuration: 'max_workers' must be at least 1, got {self.max_workers}")
+                sys.exit(1)
             logger.info(f"Loaded configuration for {len(self.bucket_configs)} source buckets")
             
         except yaml.YAMLError as e:
@@ -88,6 +195,44 @@ class S3BucketSync:
             logger.error(f"Error loading configuration: {str(e)}")
             sys.exit(1)
     
+    def _initialize_state_db(self):
+        """Open the local state database used to resume interrupted syncs."""
+        try:
+            self.state_db = sqlite3.connect(self.state_file, isolation_level=None)
+            self.state_db.execute("PRAGMA journal_mode=WAL")
+            self.state_db.execute("PRAGMA synchronous=NORMAL")
+            self.state_db.execute(
+                "CREATE TABLE IF NOT EXISTS copied ("
+                "src TEXT, dst TEXT, key TEXT, etag TEXT, "
+                "PRIMARY KEY (src, dst, key))"
+            )
+            logger.info(f"Using sync state database {self.state_file}")
+            
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open state database {self.state_file}: {str(e)}")
+            sys.exit(1)
+    
+    def _load_recorded_copies(self, source_bucket, dest_bucket):
+        """Return the (key, etag) pairs earlier runs copied from source to destination."""
+        rows = self.state_db.execute(
+            "SELECT key, etag FROM copied WHERE src = ? AND dst = ?",
+            (source_bucket, dest_bucket)
+        )
+        return set(rows)
+    
+    def _flush_state(self):
+        """Write buffered completed copies to the state database in one transaction."""
+        if not self._state_batch:
+            return
+        
+        with self.state_db:
+            self.state_db.execute("BEGIN")
+            self.state_db.executemany(
+                "INSERT OR REPLACE INTO copied (src, dst, key, etag) VALUES (?, ?, ?, ?)",
+                self._state_batch
+            )
+        self._state_batch = []
+    
     def _validate_bucket_exists(self, bucket_name):
         """Check if a bucket exists and is accessible."""
         try:
@@ -103,9 +248,9 @@ class S3BucketSync:
                 logger.error(f"Error accessing bucket '{bucket_name}': {str(e)}")
             return False
     
-    def _list_objects(self, bucket_name):
-        """List all objects in a bucket recursively."""
-        objects = []
+    def _list_objects(self, bucket_name, raise_errors=False):
+        """Yield all objects in a bucket recursively, one listing page at a time."""
+        object_count = 0
         
         try:
             paginator = self.s3_client.get_paginator('list_objects_v2')
@@ -113,65 +258,366 @@ class S3BucketSync:
             
             for page in page_iterator:
                 if 'Contents' in page:
-                    objects.extend(page['Contents'])
+                    object_count += len(page['Contents'])
+                    yield from page['Contents']
                     
-            logger.info(f"Found {len(objects)} objects in bucket '{bucket_name}'")
-            return objects
+            logger.info(f"Found {object_count} objects in bucket '{bucket_name}'")
             
         except ClientError as e:
             logger.error(f"Error listing objects in bucket '{bucket_name}': {str(e)}")
-            return []
+            if raise_errors:
+                raise
     
-    def _copy_object(self, source_bucket, dest_bucket, obj_key):
+    def _prefetch_objects(self, objects):
+        """Drain an object iterator on a background thread, yielding items as they arrive."""
+        object_queue = queue.Queue(maxsize=LISTING_QUEUE_SIZE)
+        stop = threading.Event()
+        done = object()
+        errors = []
+        
+        def put(item):
+            # Give up if the consumer has gone away instead of blocking forever
+            while not stop.is_set():
+                try:
+                    object_queue.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce():
+            try:
+                for obj in objects:
+                    if not put(obj):
+                        return
+            except Exception as e:
+                errors.append(e)
+            put(done)
+        
+        producer = threading.Thread(target=produce, name='s3-listing', daemon=True)
+        producer.start()
+        
+        try:
+            while True:
+                obj = object_queue.get()
+                if obj is done:
+                    break
+                yield obj
+            
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+    
+    @staticmethod
+    def _build_copy_source(source_bucket, obj_key, obj_size=0):
+        """Build the CopySource value for an object, shared by all its destinations."""
+        # The managed multipart copy needs the dict form, as does any key that
+        # would be misread as a version suffix. Otherwise pass the plain
+        # "bucket/key" string, which botocore percent-encodes itself.
+        if obj_size >= MULTIPART_COPY_THRESHOLD or '?versionId=' in obj_key:
+            return {'Bucket': source_bucket, 'Key': obj_key}
+        return f"{source_bucket}/{obj_key}"
+    
+    def _copy_object(self, task, copy_source=None):
         """Copy a single object from source to destination bucket."""
         try:
-            copy_source = {
-                'Bucket': source_bucket,
-                'Key': obj_key
-            }
+            if copy_source is None:
+                copy_source = self._build_copy_source(task.src, task.key, task.size)
             
-            # Use copy_object for regular files, copy for large files
-            self.s3_client.copy_object(
-                CopySource=copy_source,
-                Bucket=dest_bucket,
-                Key=obj_key
-            )
+            # Use copy_object for regular files, multipart copy for large files.
+            # CopySourceIfMatch fails the copy rather than copying a different
+            # version if the source object changed after it was listed. The
+            # multipart copy carries over source metadata from its own
+            # head_object and copies tags when TaggingDirective is COPY.
+            if task.size < MULTIPART_COPY_THRESHOLD:
+                self.s3_client.copy_object(
+                    CopySource=copy_source,
+                    Bucket=task.dst,
+                    Key=task.key,
+                    MetadataDirective='COPY',
+                    TaggingDirective='COPY',
+                    CopySourceIfMatch=task.etag
+                )
+            else:
+                self.s3_client.copy(
+                    CopySource=copy_source,
+                    Bucket=task.dst,
+                    Key=task.key,
+                    ExtraArgs={'CopySourceIfMatch': task.etag, 'TaggingDirective': 'COPY'},
+                    Config=self.transfer_config
+                )
             
             return True
             
         except ClientError as e:
-            logger.error(f"Failed to copy {obj_key} from {source_bucket} to {dest_bucket}: {str(e)}")
+            logger.error("Failed to copy %s from %s to %s: %s", task.key, task.src, task.dst, e)
             return False
         except Exception as e:
-            logger.error(f"Unexpected error copying {obj_key}: {str(e)}")
+            logger.error("Unexpected error copying %s: %s", task.key, e)
             return False
     
-    def _copy_objects_to_destinations(self, source_bucket, objects, dest_buckets):
+    def _record_results(self, done, pending, pbar):
+        """Update counters, progress and resume state for completed copy futures."""
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        completed = 0
+        
+        for future in done:
+            task = pending.pop(future)
+            copied = future.result()
+            
+            if copied:
+                self._state_batch.append(task[:4])
+                if len(self._state_batch) >= STATE_COMMIT_BATCH_SIZE:
+                    self._flush_state()
+            
+            # Counters are only updated on the thread collecting results
+            if copied:
+                self.total_files_copied += 1
+            else:
+                self.total_files_failed += 1
+            
+            if not copied:
+                logger.warning("✗ Failed to copy %s to %s", task.key, task.dst)
+            elif debug_enabled:
+                logger.debug("✓ Copied %s to %s", task.key, task.dst)
+            
+            completed += 1
+            if completed == PROGRESS_UPDATE_BATCH:
+                pbar.update(completed)
+                completed = 0
+        
+        if completed:
+            pbar.update(completed)
+    
+    def _build_object_index(self, bucket_name):
+        """Map each key in a bucket to its (Size, ETag) for change detection."""
+        return {obj['Key']: (obj['Size'], obj['ETag']) for obj in self._list_objects(bucket_name)}
+    
+    def _copy_objects_to_destinations(self, source_bucket, objects, dest_buckets, dest_indexes):
         """Copy all objects from source bucket to multiple destination buckets."""
-        total_operations = len(objects) * len(dest_buckets)
+        logger.info(f"Starting copy from {source_bucket} to {len(dest_buckets)} destination buckets")
         
-        if total_operations == 0:
-            logger.info(f"No objects to copy from {source_bucket}")
-            return
+        recorded_copies = {
+            dest_bucket: self._load_recorded_copies(source_bucket, dest_bucket) for dest_bucket in dest_buckets
+        }
         
-        logger.info(f"Starting copy of {len(objects)} objects to {len(dest_buckets)} destination buckets")
+        # Objects arrive lazily from the paginator, so cap the number of
+        # in-flight copies instead of submitting the whole bucket up front
+        max_pending = self.max_workers * 4
+        object_count = 0
         
-        with tqdm(total=total_operations, desc=f"Copying from {source_bucket}") as pbar:
-            for obj in objects:
-                obj_key = obj['Key']
-                
-                for dest_bucket in dest_buckets:
-                    if self._copy_object(source_bucket, dest_bucket, obj_key):
-                        self.total_files_copied += 1
-                        logger.debug(f"✓ Copied {obj_key} to {dest_bucket}")
-                    else:
-                        self.total_files_failed += 1
-                        logger.warning(f"✗ Failed to copy {obj_key} to {dest_bucket}")
+        try:
+            with tqdm(desc=f"Copying from {source_bucket}", unit='file', mininterval=0.5, smoothing=0) as pbar:
+                # Multipart copies run on their own executor so long copies of
+                # large objects never hold up the pool serving small ones
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                        ThreadPoolExecutor(max_workers=MULTIPART_COPY_SLOTS) as multipart_executor:
+                    pending = {}
                     
-                    pbar.update(1)
+                    try:
+                        for obj in objects:
+                            object_count += 1
+                            obj_key = obj['Key']
+                            obj_size = obj.get('Size', 0)
+                            obj_etag = obj.get('ETag')
+                            obj_state = (obj_size, obj_etag)
+                            copy_source = self._build_copy_source(source_bucket, obj_key, obj_size)
+                            
+                            # Each destination is its own task, so copies of one object
+                            # to several buckets run in parallel across the pool
+                            for dest_bucket in dest_buckets:
+                                # Skip objects already present with the same size and ETag
+                                dest_state = dest_indexes[dest_bucket].get(obj_key)
+                                if dest_state == obj_state:
+                                    self.total_files_skipped += 1
+                                    continue
+                                
+                                # Skip multipart-copied objects an earlier run recorded whose
+                                # destination copy is still in place. Multipart copies get a new
+                                # ETag, so only the size can be compared against the listing;
+                                # smaller objects keep the source ETag and are covered above.
+                                if (
+                                    obj_size >= MULTIPART_COPY_THRESHOLD
+                                    and dest_state is not None
+                                    and dest_state[0] == obj_size
+                                    and (obj_key, obj_etag) in recorded_copies[dest_bucket]
+                                ):
+                                    self.total_files_skipped += 1
+                                    continue
+                                
+                                task = CopyTask(source_bucket, dest_bucket, obj_key, obj_etag, obj_size)
+                                if obj_size < MULTIPART_COPY_THRESHOLD:
+                                    future = executor.submit(self._copy_object, task, copy_source)
+                                else:
+                                    future = multipart_executor.submit(self._copy_object, task, copy_source)
+                                pending[future] = task
+                            
+                            if len(pending) >= max_pending:
+                                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                                self._record_results(done, pending, pbar)
                     
-                    # Small delay to avoid overwhelming the API
-                    time.sleep(0.01)
+                    finally:
+                        # Count copies already submitted even if the listing failed
+                        self._record_results(as_completed(list(pending)), pending, pbar)
+        
+        finally:
+            # Persist completed copies even if the run is interrupted
+            self._flush_state()
+        
+        if object_count == 0:
+            logger.info(f"No objects found in source bucket {source_bucket}")
+    
+    def _write_batch_manifest(self, source_bucket, objects, manifest_bucket):
+        """Write a Batch Operations CSV manifest of the source objects and upload it.
+        
+        Returns the manifest location (None if nothing was written), the number
+        of objects in it, and the objects too large for S3PutObjectCopy.
+        """
+        manifest_key = f"{BATCH_MANIFEST_PREFIX}/{source_bucket}-{int(time.time())}.csv"
+        object_count = 0
+        large_objects = []
+        
+        # Stream the listing to disk so the manifest never has to fit in memory
+        with tempfile.NamedTemporaryFile('w', newline='', suffix='.csv') as manifest:
+            writer = csv.writer(manifest)
+            for obj in objects:
+                # S3PutObjectCopy always fails objects of 5 GB or more
+                if obj.get('Size', 0) >= MULTIPART_COPY_THRESHOLD:
+                    large_objects.append(obj)
+                    continue
+                
+                # Batch Operations expects URL-encoded keys in CSV manifests
+                writer.writerow([source_bucket, quote(obj['Key'])])
+                object_count += 1
+            manifest.flush()
+            
+            if object_count == 0:
+                return None, 0, large_objects
+            
+            self.s3_client.upload_file(manifest.name, manifest_bucket, manifest_key)
+        
+        etag = self.s3_client.head_object(Bucket=manifest_bucket, Key=manifest_key)['ETag'].strip('"')
+        logger.info(f"Uploaded manifest of {object_count} objects to s3://{manifest_bucket}/{manifest_key}")
+        return {'ObjectArn': f"arn:aws:s3:::{manifest_bucket}/{manifest_key}", 'ETag': etag}, object_count, large_objects
+    
+    def _wait_for_batch_jobs(self, s3control, account_id, jobs, tasks_per_job):
+        """Poll Batch Operations jobs until they finish and record their results."""
+        remaining = dict(jobs)
+        
+        while remaining:
+            time.sleep(BATCH_POLL_INTERVAL)
+            
+            for job_id, dest_bucket in list(remaining.items()):
+                job = s3control.describe_job(AccountId=account_id, JobId=job_id)['Job']
+                status = job['Status']
+                if status not in BATCH_TERMINAL_STATUSES:
+                    logger.debug("Batch job %s to %s is %s", job_id, dest_bucket, status)
+                    continue
+                
+                del remaining[job_id]
+                progress = job.get('ProgressSummary', {})
+                succeeded = progress.get('NumberOfTasksSucceeded', 0)
+                failed = progress.get('NumberOfTasksFailed', 0)
+                
+                # Tasks never attempted by a failed or cancelled job count as failures
+                if status != 'Complete':
+                    failed = max(failed, tasks_per_job - succeeded)
+                
+                self.total_files_copied += succeeded
+                self.total_files_failed += failed
+                
+                if status == 'Complete' and failed == 0:
+                    logger.info(f"Batch job {job_id} to {dest_bucket} completed: {succeeded} objects copied")
+                else:
+                    logger.error(
+                        f"Batch job {job_id} to {dest_bucket} finished with status {status}: "
+                        f"{succeeded} copied, {failed} failed"
+                    )
+    
+    def _create_batch_jobs(self, s3control, account_id, source_bucket, dest_buckets, manifest_location,
+                           manifest_bucket, role_arn):
+        """Create one S3PutObjectCopy Batch Operations job per destination bucket."""
+        jobs = {}
+        for dest_bucket in dest_buckets:
+            response = s3control.create_job(
+                AccountId=account_id,
+                ConfirmationRequired=False,
+                Operation={
+                    'S3PutObjectCopy': {
+                        'TargetResource': f"arn:aws:s3:::{dest_bucket}",
+                        'MetadataDirective': 'COPY'
+                    }
+                },
+                Manifest={
+                    'Spec': {
+                        'Format': 'S3BatchOperations_CSV_20180820',
+                        'Fields': ['Bucket', 'Key']
+                    },
+                    'Location': manifest_location
+                },
+                Report={
+                    'Bucket': f"arn:aws:s3:::{manifest_bucket}",
+                    'Prefix': BATCH_MANIFEST_PREFIX,
+                    'Format': 'Report_CSV_20180820',
+                    'Enabled': True,
+                    'ReportScope': 'FailedTasksOnly'
+                },
+                Priority=10,
+                RoleArn=role_arn,
+                ClientRequestToken=str(uuid.uuid4()),
+                Description=f"s3-sync {source_bucket} -> {dest_bucket}"
+            )
+            jobs[response['JobId']] = dest_bucket
+            logger.info(f"Created batch job {response['JobId']} copying {source_bucket} to {dest_bucket}")
+        
+        return jobs
+    
+    def _run_batch_copy(self, config, source_bucket, dest_buckets):
+        """Copy a source bucket with S3 Batch Operations instead of client-side requests."""
+        role_arn = config.get('batch_role_arn')
+        manifest_bucket = config.get('manifest_bucket')
+        
+        if not role_arn or not manifest_bucket:
+            logger.error(f"Batch mode for {source_bucket} requires 'batch_role_arn' and 'manifest_bucket'")
+            self.total_buckets_failed += 1
+            return
+        
+        try:
+            # A partial listing would silently launch jobs for only part of
+            # the bucket, so listing errors abort the batch copy
+            manifest_location, object_count, large_objects = self._write_batch_manifest(
+                source_bucket, self._list_objects(source_bucket, raise_errors=True), manifest_bucket
+            )
+            
+            if manifest_location is None and not large_objects:
+                logger.info(f"No objects found in source bucket {source_bucket}")
+                return
+            
+            # Start the batch jobs before any client-side copies so large
+            # objects are copied while the jobs run, not ahead of them
+            jobs = {}
+            if manifest_location is not None:
+                account_id = self.session.client('sts').get_caller_identity()['Account']
+                s3control = self.session.client('s3control')
+                jobs = self._create_batch_jobs(
+                    s3control, account_id, source_bucket, dest_buckets, manifest_location, manifest_bucket, role_arn
+                )
+            
+            if large_objects:
+                logger.info(f"Copying {len(large_objects)} objects of 5 GB or more client-side")
+                self._copy_objects_to_destinations(
+                    source_bucket, large_objects, dest_buckets, {dest_bucket: {} for dest_bucket in dest_buckets}
+                )
+            
+            if jobs:
+                self._wait_for_batch_jobs(s3control, account_id, jobs, object_count)
+            
+        except (ClientError, BotoCoreError, Boto3Error) as e:
+            # Covers failed manifest uploads (S3UploadFailedError) and client
+            # setup errors such as a missing region, not just API errors
+            logger.error(f"Batch copy from {source_bucket} failed: {str(e)}")
+            self.total_buckets_failed += 1
     
     def _process_bucket_config(self, config):
         """Process a single bucket configuration."""
@@ -183,15 +629,19 @@ class S3BucketSync:
         logger.info(f"Destination buckets: {', '.join(dest_buckets)}")
         logger.info(f"{'='*60}")
         
-        # Validate source bucket
-        if not self._validate_bucket_exists(source_bucket):
+        # Validate source and destination buckets concurrently
+        buckets = [source_bucket] + list(dest_buckets)
+        with ThreadPoolExecutor(max_workers=len(buckets)) as executor:
+            futures = {executor.submit(self._validate_bucket_exists, bucket): bucket for bucket in buckets}
+            bucket_valid = {futures[future]: future.result() for future in as_completed(futures)}
+        
+        if not bucket_valid[source_bucket]:
             logger.error(f"Skipping {source_bucket} due to validation failure")
             return
         
-        # Validate destination buckets
         valid_dest_buckets = []
         for dest_bucket in dest_buckets:
-            if self._validate_bucket_exists(dest_bucket):
+            if bucket_valid[dest_bucket]:
                 valid_dest_buckets.append(dest_bucket)
             else:
                 logger.warning(f"Skipping destination bucket {dest_bucket}")
@@ -200,25 +650,40 @@ class S3BucketSync:
             logger.error(f"No valid destination buckets for {source_bucket}")
             return
         
-        # List objects in source bucket
-        objects = self._list_objects(source_bucket)
-        
-        if not objects:
-            logger.info(f"No objects found in source bucket {source_bucket}")
+        # Very large buckets can be handed off to S3 Batch Operations
+        if config.get('mode') == 'batch':
+            self._run_batch_copy(config, source_bucket, valid_dest_buckets)
             return
         
+        # Index destination contents so unchanged objects are not re-copied,
+        # listing all destinations concurrently
+        with ThreadPoolExecutor(max_workers=len(valid_dest_buckets)) as executor:
+            dest_indexes = dict(zip(valid_dest_buckets, executor.map(self._build_object_index, valid_dest_buckets)))
+        
+        # Stream objects from the source bucket listing, which runs on its own
+        # thread so listing round trips overlap with copying. A listing that
+        # fails partway is raised so the bucket is reported as failed.
+        objects = self._prefetch_objects(self._list_objects(source_bucket, raise_errors=True))
+        
         # Copy objects to destination buckets
-        self._copy_objects_to_destinations(source_bucket, objects, valid_dest_buckets)
+        try:
+            self._copy_objects_to_destinations(source_bucket, objects, valid_dest_buckets, dest_indexes)
+        except ClientError:
+            logger.error(f"Sync of {source_bucket} stopped early because its listing failed")
+            self.total_buckets_failed += 1
     
     def sync_buckets(self):
         """Main method to sync all buckets according to configuration."""
         logger.info("Starting S3 bucket sync process")
         
+        # Load configuration first so the client pool matches max_workers
+        self._load_config()
+        
         # Initialize S3 client
         self._initialize_s3_client()
         
-        # Load configuration
-        self._load_config()
+        # Open resume state
+        self._initialize_state_db()
         
         # Process each bucket configuration
         start_time = time.time()
@@ -228,8 +693,11 @@ class S3BucketSync:
                 self._process_bucket_config(config)
             except Exception as e:
                 logger.error(f"Error processing bucket config: {str(e)}")
+                self.total_buckets_failed += 1
                 continue
         
+        self.state_db.close()
+        
         # Print summary
         end_time = time.time()
         duration = end_time - start_time
@@ -239,11 +707,17 @@ class S3BucketSync:
         logger.info(f"{'='*60}")
         logger.info(f"Total files copied successfully: {self.total_files_copied}")
         logger.info(f"Total files failed: {self.total_files_failed}")
+        logger.info(f"Total files skipped (unchanged): {self.total_files_skipped}")
+        if self.total_buckets_failed > 0:
+            logger.info(f"Total buckets failed: {self.total_buckets_failed}")
         logger.info(f"Total time: {duration:.2f} seconds")
         logger.info(f"{'='*60}")
         
-        if self.total_files_failed > 0:
-            logger.warning(f"Sync completed with {self.total_files_failed} failures. Check logs for details.")
+        if self.total_files_failed > 0 or self.total_buckets_failed > 0:
+            logger.warning(
+                f"Sync completed with {self.total_files_failed + self.total_buckets_failed} failures. "
+                "Check logs for details."
+            )
             sys.exit(1)
         else:
             logger.info("All files synced successfully!")